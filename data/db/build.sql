@@ -82,6 +82,10 @@ CREATE TABLE IF NOT EXISTS purposed_objects (
     UNIQUE (purpose_id, object_id) ON CONFLICT REPLACE
 );
 
+-- Purposed objects are almost always looked up per guild and purpose
+CREATE INDEX IF NOT EXISTS idx_purposed_objects_guild_purpose
+    ON purposed_objects (guild_id, purpose_id);
+
 -- Settings --------------------------------------------------------------------
 
 -- Table to store settings (not settings values)
@@ -140,6 +144,10 @@ CREATE TABLE IF NOT EXISTS tickets (
     FOREIGN KEY (guild_id) REFERENCES guilds(guild_id) ON DELETE CASCADE
 );
 
+-- id is the rowid so it is already indexed, tickets are listed by guild
+CREATE INDEX IF NOT EXISTS idx_tickets_guild_active
+    ON tickets (guild_id, active);
+
 -- #76 - Add Reaction Roles
 -- Store Reaction Roles Here
 CREATE TABLE IF NOT EXISTS reaction_roles (
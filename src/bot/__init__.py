@@ -4,6 +4,7 @@ import os
 import time
 import logging
 import asyncio
+from functools import lru_cache
 from sqlite3 import IntegrityError
 from datetime import timedelta
 
@@ -14,18 +15,25 @@ from db import db
 from db.enums import ChannelPurposes
 from ui import ManageTicketView
 from ._get import Get
-from ._logs import setup_logs
+from ._logs import setup_logs, flush_logs
 from ._ext import CogManager
 
 
 log = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _format_uptime(seconds:int) -> str:
+    """Format an uptime in seconds, calls in the same second share a string"""
+
+    return str(timedelta(seconds=seconds))
+
 
 class Bot(commands.Bot):
     """This class is the root of the bot."""
 
     __slots__ = (
         "_start_time",
+        "_start_time_str",
         "log_filepath",
         "get",
         "cog_events",
@@ -41,6 +49,10 @@ class Bot(commands.Bot):
 
         # Roughly the time the bot was started
         self._start_time = time.time()
+        self._start_time_str = time.strftime(
+            '%Y-%m-%d %H:%M:%S',
+            time.localtime(self._start_time)
+        )
 
         super().__init__(
             command_prefix="ob ",
@@ -80,12 +92,17 @@ class Bot(commands.Bot):
         difference = int(round(time.time() - self._start_time))
         return timedelta(seconds=difference)
 
+    @property
+    def uptime_str(self) -> str:
+        """Returns the bot's uptime formatted as a string"""
+
+        return _format_uptime(int(round(time.time() - self._start_time)))
+
     @property
     def start_time(self) -> str:
         """Returns the bot's start time as a string object"""
 
-        _time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._start_time))
-        return f'{_time}'
+        return self._start_time_str
 
     async def sync_app_commands(self) -> None:
         """Sync app commands with discord"""
@@ -150,6 +167,7 @@ class Bot(commands.Bot):
 
             # Follow up with a new log file if requested
             if include_file:
+                flush_logs()
                 filename = os.path.basename(self.log_filepath)
                 file = discord.File(self.log_filepath, filename=filename)
                 await channel.send(file=file)
@@ -190,7 +208,7 @@ class Bot(commands.Bot):
 
         log.info("Bot has logged-in and is ready!")
         log.debug(
-            f"Name: %s - ID: %s",
+            "Name: %s - ID: %s",
             self.user.name,
             self.user.id
         )
@@ -224,11 +242,17 @@ class Bot(commands.Bot):
         # Send a ready message to all logging channels
         await self.send_logs(
             'I\'m shutting down, here are the logs for this session.' \
-            f'\nStarted: {filename[:-4]}\nUptime: {str(self.uptime)}',
+            f'\nStarted: {filename[:-4]}\nUptime: {self.uptime_str}',
             include_file=True
         )
         await super().close()
 
+        # Every cog shares the one long-lived connection, so it is only
+        # closed once the bot itself has shut down. Stop the autosave
+        # first so it can't commit on a closed connection.
+        self._autosave_db.cancel()
+        db.close()
+
     async def load_extensions(self):
         """Searches through the ./ext/ directory and loads them"""
 
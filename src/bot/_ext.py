@@ -49,8 +49,9 @@ class CogManager(BaseCog, name='Cog Manager'):
         """
 
         log.info(
-            f'{inter.user.name}#{inter.user.discriminator} '
-            f'({inter.user.id}) is {action}ing cog: {cog.name}'
+            '%s#%s (%s) is %sing cog: %s',
+            inter.user.name, inter.user.discriminator,
+            inter.user.id, action, cog.name
         )
 
         await inter.response.defer(ephemeral=True)
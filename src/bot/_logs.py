@@ -2,11 +2,14 @@
 Handle async logging for the project
 """
 
+import os
 import sys
+import time
 import queue
+import atexit
 import logging
 from logging.handlers import QueueHandler, QueueListener
-from datetime import datetime, timedelta
+from datetime import datetime
 from itertools import count
 from typing import TextIO
 from pathlib import Path
@@ -14,12 +17,36 @@ from pathlib import Path
 from constants import (
     LOGS,
     LOG_FILENAME_FORMAT_PREFIX,
+    LOG_FILE_BUFFER_SIZE,
     MAX_LOGFILE_AGE_DAYS
 )
 
 
 log = logging.getLogger(__name__)
 
+# Set by setup_logs, used by flush_logs
+_queue_listener: QueueListener | None = None
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that lets the stream buffer writes instead of flushing
+    after every record. Warnings and above are still flushed right away.
+    """
+
+    def emit(self, record:logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+
+        except RecursionError:
+            raise
+
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
 def _open_file() -> TextIO:
     """
     Returns a file object for the current log file.
@@ -28,17 +55,36 @@ def _open_file() -> TextIO:
     # Create the logs directory if it doesnt exist
     Path(LOGS).mkdir(exist_ok=True)
 
-    # Create a generator to generate a unique filename
     timestamp = datetime.now().strftime(LOG_FILENAME_FORMAT_PREFIX)
+
+    # Start after the highest suffix already used for this timestamp
+    # so we don't have to fail our way through every taken filename
+    start = 0
+    for name in os.listdir(LOGS):
+        if not name.startswith(timestamp) or not name.endswith('.txt'):
+            continue
+
+        suffix = name[len(timestamp):-len('.txt')]
+        if suffix.startswith('_(') and suffix[2:-1].isdigit():
+            start = max(start, int(suffix[2:-1]) + 1)
+        else:
+            start = max(start, 1)
+
+    # Create a generator to generate a unique filename
     filenames = (
         f'{timestamp}.txt' if i == 0 else f'{timestamp}_({i}).txt' \
-            for i in count()
+            for i in count(start)
     )
     
-    # Find a filename that doesn't already exist and return it
+    # Find a filename that doesn't already exist and return it, the
+    # loop only continues if another process took the name first
     for filename in filenames:
         try:
-            return (Path(f'{LOGS}/{filename}').open('x', encoding='utf-8'))
+            return Path(f'{LOGS}/{filename}').open(
+                'x',
+                buffering=LOG_FILE_BUFFER_SIZE,
+                encoding='utf-8'
+            )
         except FileExistsError:
             continue
 
@@ -48,18 +94,21 @@ def _delete_old_logs():
     The max age in days for log files is defined in src/constants.py
     """
 
-    for path in Path(LOGS).glob('*.txt'):
-        prefix = path.stem.split('_')[0]
-        try:
-            log_date = datetime.strptime(prefix, LOG_FILENAME_FORMAT_PREFIX)
-        except ValueError:
-            log.warning(f'{path.parent} contains a problematic filename: {path.name}')
-            continue
-        
-        age = datetime.now() - log_date
-        if age >= timedelta(days=MAX_LOGFILE_AGE_DAYS):
-            log.info(f'Removing expired log file: {path.name}')
-            path.unlink()
+    # Compare modification times against a single cutoff rather than
+    # parsing the date out of every filename
+    cutoff = time.time() - MAX_LOGFILE_AGE_DAYS * 86400
+
+    with os.scandir(LOGS) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.txt'):
+                continue
+
+            if not entry.is_file(follow_symlinks=False):
+                continue
+
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                log.info('Removing expired log file: %s', entry.name)
+                os.unlink(entry.path)
 
 def update_log_levels(logger_names:tuple[str], level:int):
     """
@@ -69,12 +118,37 @@ def update_log_levels(logger_names:tuple[str], level:int):
         logger=logging.getLogger(name)
         logger.setLevel(level)
 
+def flush_logs():
+    """
+    Write out every queued and buffered record, call this before reading
+    the log file.
+    """
+    if _queue_listener is None:
+        return
+
+    # Stopping the listener handles everything already in the queue,
+    # anything logged meanwhile waits in the queue for the restart
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.flush()
+
+    _queue_listener.start()
+
+def _stop_logs():
+    """
+    Write out every queued and buffered record, registered to run at exit.
+    """
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.flush()
+
 def setup_logs(log_level:int=logging.DEBUG) -> str:
     """
     Setup a logging queue handler and queue listener.
     Also creates a new log file for the current session and deletes old
     log files.
     """
+    global _queue_listener  # pylint: disable=global-statement
 
     # Create a queue to pass log records to the listener
     log_queue = queue.Queue()
@@ -90,12 +164,13 @@ def setup_logs(log_level:int=logging.DEBUG) -> str:
     file = _open_file()
 
     # Create handlers for the log output
-    file_handler = logging.StreamHandler(file)
+    file_handler = _BufferedStreamHandler(file)
     sys_handler = logging.StreamHandler(sys.stdout)
 
     # Create a listener to handle the queue
-    queue_listener = QueueListener(log_queue, file_handler, sys_handler)
-    queue_listener.start()
+    _queue_listener = QueueListener(log_queue, file_handler, sys_handler)
+    _queue_listener.start()
+    atexit.register(_stop_logs)
     
     # Mute loud loggers
     update_log_levels(
@@ -32,6 +32,7 @@ NO_CONFIG = 'CRITICAL ERROR: config file is missing! Shutting down...'
 LOGS = 'logs/'
 LOG_FILENAME_FORMAT_PREFIX = '%Y-%m-%d %H-%M-%S'
 MAX_LOGFILE_AGE_DAYS = 7
+LOG_FILE_BUFFER_SIZE = 65536
 
 # Levelcard constants
 BLACK = "#0F0F0F"
@@ -14,6 +14,18 @@ conn = connect(DB_PATH, check_same_thread=False)
 cur = conn.cursor()
 cur.execute("PRAGMA foreign_keys = ON;")  # enable foreign keys
 
+# WAL + NORMAL sync means commits only fsync the write-ahead log,
+# journal_mode is persisted in the database file, the rest are per connection
+cur.executescript(
+    """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -64000;
+    """
+)
+
 log.info("Database connection established")
 
 def with_commit(func):
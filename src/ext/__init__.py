@@ -28,4 +28,4 @@ class BaseCog(commands.Cog):
         event.set()
         
 
-        log.info(f"Cog loaded: {self.qualified_name}")
+        log.info("Cog loaded: %s", self.qualified_name)
@@ -11,6 +11,18 @@ from . import BaseCog
 
 log = logging.getLogger(__name__)
 
+# These can't change while the process is running, so they are
+# formatted once at import and reused by every /host info
+_STATIC_INFO = (
+    '\n--- Dependencies ---\n'
+    f'Python: {platform.python_version()}\n'
+    f'Discord.py: {discord.__version__}\n'
+    '\n--- Server ---\n'
+    f'OS: {platform.system()}\n'
+    f'OS Version: {platform.release()}\n'
+)
+_TIMEZONE = time.tzname[1]
+
 
 class HostCog(BaseCog, name='Host Interactions'):
     """Cog for info commands."""
@@ -26,53 +38,37 @@ class HostCog(BaseCog, name='Host Interactions'):
         description='Server commands'
     )
 
-    def _get_data(self) -> dict:
-        return {
-            'Bot': {
-                'Name': self.bot.user.name,
-                'Descriminator': f'#{self.bot.user.discriminator}',
-                'ID': self.bot.user.id,
-            },
-            'Dependencies': {
-                'Python': platform.python_version(),
-                'Discord.py': discord.__version__,
-            },
-            'Server': {
-                'OS': platform.system(),
-                'OS Version': platform.release(),
-            },
-            'Runtime': {
-                'Uptime': str(self.bot.uptime),
-                'Start Time': self.bot.start_time,
-                'Timezone': time.tzname[1],
-            },
-            'Network': {
-                'Latency': f'{round(self.bot.latency*1000, 2)}ms',
-            }
-        }
+    def _get_desc(self) -> str:
+        # The bot user isn't known until login, so only its section and
+        # the runtime values are formatted per call
+        user = self.bot.user
+        return (
+            '\n--- Bot ---\n'
+            f'Name: {user.name}\n'
+            f'Descriminator: #{user.discriminator}\n'
+            f'ID: {user.id}\n'
+            f'{_STATIC_INFO}'
+            '\n--- Runtime ---\n'
+            f'Uptime: {self.bot.uptime_str}\n'
+            f'Start Time: {self.bot.start_time}\n'
+            f'Timezone: {_TIMEZONE}\n'
+            '\n--- Network ---\n'
+            f'Latency: {round(self.bot.latency*1000, 2)}ms\n'
+        )
 
     @group.command(name='uptime')
     async def server_uptime(self, inter:Inter):
         """Get the uptime of the bot."""
 
-        uptime = str(self.bot.uptime)
+        uptime = self.bot.uptime_str
         await inter.response.send_message(f'Uptime: {uptime}', ephemeral=True)
 
     @group.command(name='info')
     async def server_info(self, inter:Inter):
         """Get info on the bot & server."""
 
-        # Get the info/data
-        data = self._get_data()      
-
-        # Embed description
-        desc = ''
-
-        # Add the data to the description
-        for k, v in data.items():
-            desc += f'\n--- {k} ---\n'
-            for k2, v2 in v.items():
-                desc += f'{k2}: {v2}\n'
+        # Get the info/data for the description
+        desc = self._get_desc()
 
         # Create and send the embed to the interaction
         embed = discord.Embed(
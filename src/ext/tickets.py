@@ -24,26 +24,61 @@ from . import BaseCog
 
 log = logging.getLogger(__name__)
 
-def _check_guild_has_tickets(inter:Inter):
-    """Check if the guild has tickets enabled
+# Queries are built once here so sqlite's statement cache gets the same
+# string on every call instead of a freshly formatted one
+_PURPOSED_OBJECT_SQL = (
+    "SELECT object_id FROM purposed_objects "
+    "WHERE guild_id = ? AND purpose_id = ?"
+)
+_LIST_TICKETS_SQL = (
+    "SELECT id, member_id, active FROM tickets WHERE guild_id = ?"
+)
+
+# /list-tickets `active` option -> (query, not found message)
+_LIST_TICKETS_DISPATCH = {
+    None: (
+        _LIST_TICKETS_SQL,
+        "I could not find any tickets"
+    ),
+    True: (
+        _LIST_TICKETS_SQL + " AND active = 1",
+        "I could not find any active tickets"
+    ),
+    False: (
+        _LIST_TICKETS_SQL + " AND active = 0",
+        "I could not find any inactive tickets"
+    ),
+}
+
+def _get_ticket_category(guild:discord.Guild) -> CategoryChannel | None:
+    """Get the first of the guild's ticket categories that still exists
 
     Returns:
-        bool: True if the guild has tickets enabled
+        CategoryChannel: The ticket category
+        None: If none of the purposed categories exist
     """
 
-    data = db.column(
-        "SELECT object_id FROM purposed_objects WHERE purpose_id = ?",
-        CategoryPurposes.tickets.value
+    category_ids = db.column(
+        _PURPOSED_OBJECT_SQL,
+        guild.id, CategoryPurposes.tickets.value
     )
-    if not data: 
-        raise app_commands.CheckFailure(NO_TICKETS_ERR)
 
-    exists = any(
-        channel for channel in inter.guild.channels
-        if channel.id in data
-    )
+    # Skip any categories deleted since they were purposed
+    for category_id in category_ids:
+        category = guild.get_channel(category_id)
+        if category is not None:
+            return category
+
+    return None
+
+def _check_guild_has_tickets(inter:Inter):
+    """Check if the guild has tickets enabled
+
+    Returns:
+        bool: True if the guild has tickets enabled
+    """
 
-    if not exists:
+    if _get_ticket_category(inter.guild) is None:
         raise app_commands.CheckFailure(NO_TICKETS_ERR)
 
     return True
@@ -63,16 +98,7 @@ class TicketsCog(BaseCog, name="Tickets"):
             active (bool, optional): Whether to list only active tickets or not.
             """
 
-        if active is None:
-            not_found = "I could not find any tickets"
-        elif active:
-            not_found = "I could not find any active tickets"
-        else:
-            not_found = "I could not find any inactive tickets"
-
-        query = "SELECT id, member_id, active  FROM tickets WHERE guild_id = ?"
-        if active is not None:
-            query += f" AND active = {int(active)}"
+        query, not_found = _LIST_TICKETS_DISPATCH[active]
 
         tickets_data = db.records(query, inter.guild.id)
         if not tickets_data:
@@ -126,17 +152,14 @@ class TicketsCog(BaseCog, name="Tickets"):
 
         log.debug("Getting tickets category")
 
-        category_id = db.field(
-            "SELECT object_id FROM purposed_objects WHERE purpose_id = ?",
-            CategoryPurposes.tickets.value
-        )
-        category = await self.bot.get.channel(category_id)
+        category = _get_ticket_category(inter.guild)
         if not category:
             log.debug("Could not find tickets category, cancelling")
             await inter.followup.send(
                 "I could not find the ticket category",
                 ephemeral=True
             )
+            return
 
         log.debug("Checking channels")
 
@@ -264,28 +287,36 @@ class TicketsCog(BaseCog, name="Tickets"):
             now = datetime.now()
             timestamp = int(now.timestamp())
 
-            cur = db.execute(
+            # Read the id back from the insert itself, the shared cursor's
+            # lastrowid can be overwritten by other inserts while we await
+            ticket_id = db.field(
                 "INSERT INTO tickets "
                 "(guild_id, member_id, description, timestamp)  "
-                "VALUES (?, ?, ?, ?)",
+                "VALUES (?, ?, ?, ?) RETURNING id",
                 inter.guild.id,
                 inter.user.id,
                 description,
                 timestamp
             )
 
-            channel = await self.create_ticket_channel(
-                ticket_id=cur.lastrowid,
-                member=inter.user
-            )
+            # Undo the insert so a failed channel doesn't leave an active
+            # ticket, the autosave may or may not have committed it already
+            try:
+                channel = await self.create_ticket_channel(
+                    ticket_id=ticket_id,
+                    member=inter.user
+                )
+            except Exception:
+                db.execute("DELETE FROM tickets WHERE id = ?", ticket_id)
+                raise
             await channel.send(
                 embed=ManageTicketEmbed(
-                    ticket_id=cur.lastrowid,
+                    ticket_id=ticket_id,
                     desc=description,
                     member=inter.user,
                     timestamp=now  # datetime object needed
                 ),
-                view=ManageTicketView(ticket_id=cur.lastrowid)
+                view=ManageTicketView(ticket_id=ticket_id)
             )
 
             await inter.response.send_message(
@@ -316,17 +347,8 @@ class TicketsCog(BaseCog, name="Tickets"):
         log.debug("Creating ticket channel for ticket #%s", ticket_id)
 
         # Get the category to create the channel in
-        category_ids = db.column(
-            "SELECT object_id FROM purposed_objects WHERE "
-            "purpose_id = ?",
-            CategoryPurposes.tickets.value
-        )
-
-        for category_id in category_ids:
-            category: CategoryChannel = await self.bot.get.channel(category_id)
-            if category.guild.id == member.guild.id:
-                break
-        else:
+        category = _get_ticket_category(member.guild)
+        if category is None:
             raise EmptyQueryResult
 
         overwrites = {}
@@ -342,30 +364,17 @@ class TicketsCog(BaseCog, name="Tickets"):
         )
 
         # get the admin and moderator roles to add to the channel perms
-        admin_role_ids = db.column(
-            "SELECT object_id FROM purposed_objects WHERE "
-            "purpose_id = ?",
-            RolePurposes.admin.value
-        )
-
-        for admin_role_id in admin_role_ids:
-            admin_role: Role = await self.bot.get.role(admin_role_id, member.guild.id)
-            if admin_role.guild.id == member.guild.id:
-                overwrites[admin_role] = access_overwrite
-                break
-
-        # TODO: make a util function for this repeated code
-        mod_role_ids = db.column(
-            "SELECT object_id FROM purposed_objects WHERE "
-            "purpose_id = ?",
-            RolePurposes.mod.value
-        )
+        # skipping any that have been deleted since they were purposed
+        for purpose in (RolePurposes.admin, RolePurposes.mod):
+            role_ids = db.column(
+                _PURPOSED_OBJECT_SQL,
+                member.guild.id, purpose.value
+            )
 
-        for mod_role_id in mod_role_ids:
-            mod_role: Role = await self.bot.get.role(mod_role_id, member.guild.id)
-            if mod_role.guild.id == member.guild.id:
-                overwrites[mod_role] = access_overwrite
-                break
+            for role_id in role_ids:
+                role: Role = member.guild.get_role(role_id)
+                if role is not None:
+                    overwrites[role] = access_overwrite
 
         # Grant access to the ticket opener
         overwrites[member] = access_overwrite
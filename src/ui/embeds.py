@@ -215,7 +215,7 @@ class AddedTrackEmbed(discord.Embed):
                 est_time = datetime.now() + timedelta(
                     seconds=duration_sum
                 )
-                log.debug(f"Found song in queue, {est_time=}")
+                log.debug("Found song in queue, est_time=%s", est_time)
                 return f"<t:{int(est_time.timestamp())}:R>"
 
             # Add the duration of the song to the duration sum
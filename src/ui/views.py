@@ -270,7 +270,12 @@ class ManageTicketView(dui.View):
             f"<t:{delete_at_timestamp}:R>"
         )
         await asyncio.sleep(seconds)
-        await inter.delete_original_response()
+
+        # The message may already be gone, along with its channel
+        try:
+            await inter.delete_original_response()
+        except discord.NotFound:
+            log.debug("Countdown message was already deleted")
 
         # Try to delete the channel
         # If we can't delete the channel, log the error
@@ -278,6 +283,10 @@ class ManageTicketView(dui.View):
             await inter.channel.delete(reason="Ticket deleted")
             log.debug("Channel deleted")
 
+        except discord.NotFound:
+            # Someone beat us to it during the countdown
+            log.debug("Channel was already deleted")
+
         except discord.Forbidden as err:
             log.error(err)
             await inter.followup.send(